@@ -1,19 +1,34 @@
 #!/usr/bin/env python3
 import os
 import sys
+import argparse
+import asyncio
+import functools
 import platform
+import concurrent.futures
+import contextlib
+import shutil
+import importlib.util
 import subprocess
-import random
+import copy
+import uuid
+import threading
+import json
+import sqlite3
+import zlib
+from collections import OrderedDict
 import time
 from pathlib import Path
-from urllib.parse import urlparse
-from yt_dlp import YoutubeDL
-from tqdm import tqdm
+import urllib.request
+from urllib.parse import urlparse, parse_qsl, urlencode
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress
-from rich import print as rprint
+from rich.progress import (
+    Progress, TextColumn, BarColumn, DownloadColumn, TransferSpeedColumn, TimeRemainingColumn, MofNCompleteColumn,
+)
+from rich.live import Live
+from rich.console import Group
 from rich.text import Text
 from rich.box import ROUNDED
 
@@ -30,231 +45,786 @@ SUPPORTED_SITES = [
     "YouTube", "TikTok", "Facebook", "Instagram (reels/posts)", 
     "Twitter/X", "Reddit", "Vimeo", "Dailymotion", "SoundCloud"
 ]
+DEFAULT_CONCURRENCY = 5
+PROGRESS_INTERVAL = 0.1  # seconds between progress redraws
+DEFAULT_FRAGMENTS = 8
+PREFETCH_WORKERS = 10
+DIRECT_MEDIA_EXTENSIONS = ('.mp4', '.m4a', '.mp3', '.webm', '.mkv')
+DIRECT_CHUNK_SIZE = 1 << 20
+DOWNLOAD_BUFFER_SIZE = 1 << 20  # yt-dlp's starting read size (default 1 KiB)
+HTTP_CHUNK_SIZE = 10 << 20
+ANDROID_HTTP_CHUNK_SIZE = 4 << 20
+DOWNLOAD_RETRIES = 10
+# Caps ffmpeg's demux/mux and decode threads in yt-dlp's postprocessors:
+# stream-copy merges and libmp3lame (itself single-threaded) only need a few
+FFMPEG_THREADS = 4
+# Separate best video + audio streams merged by ffmpeg; plain 'best' only
+# picks progressive files, which YouTube caps at 720p.
+DEFAULT_VIDEO_FORMAT = 'bv*[ext=mp4]+ba[ext=m4a]/b[ext=mp4]/b'
+VIDEO_QUALITIES = {
+    '1': ("Best available", DEFAULT_VIDEO_FORMAT),
+    '2': ("1080p", 'bv*[height<=1080]+ba/b[height<=1080]'),
+    '3': ("720p", 'bv*[height<=720]+ba/b[height<=720]'),
+    '4': ("480p", 'bv*[height<=480]+ba/b[height<=480]'),
+}
+# yt-dlp aborts any "+" merge when ffmpeg is missing, so without it each
+# choice falls back to the best single file within the same limits.
+SINGLE_FILE_FORMATS = {
+    DEFAULT_VIDEO_FORMAT: 'b[ext=mp4]/b',
+    'bv*[height<=1080]+ba/b[height<=1080]': 'b[height<=1080]/b',
+    'bv*[height<=720]+ba/b[height<=720]': 'b[height<=720]/b',
+    'bv*[height<=480]+ba/b[height<=480]': 'b[height<=480]/b',
+}
+INFO_CACHE_TTL = 600  # seconds an extracted info dict stays reusable
+INFO_CACHE_SIZE = 256
+FILENAME_PREFIX = "AnmolKhadkaSocialMediaGrabber"
+AUDIO_NAME = "%(id)s.audio"  # never picks up (and then deletes) a video file of the same ID
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache") / "smgrabber"
+INFO_DB_PATH = CACHE_DIR / "info.sqlite3"
+YTDLP_CACHE_DIR = CACHE_DIR / "ytdlp"
+INFO_DB_TTL = 7 * 24 * 3600  # seconds a persisted metadata entry is shown without re-fetching
+TRACKING_PARAMS = ('si', 'feature')  # plus any utm_* parameter
+ARIA2C_ARGS = ['-x', '16', '-s', '16', '-k', '1M', '--summary-interval=0']
+# Ordered by how often each site shows up in typical batches.
+PLATFORM_DOMAINS = {
+    'youtube': ('youtube.com', 'youtu.be'),
+    'tiktok': ('tiktok.com',),
+    'instagram': ('instagram.com',),
+    'twitter': ('twitter.com', 'x.com'),
+    'facebook': ('facebook.com', 'fb.watch'),
+    'reddit': ('reddit.com', 'redd.it'),
+    'soundcloud': ('soundcloud.com',),
+    'vimeo': ('vimeo.com',),
+    'dailymotion': ('dailymotion.com', 'dai.ly'),
+}
+
+# Flat domain -> platform map; lookups walk the host's parent domains, so
+# "m.youtube.com" matches "youtube.com" but "notyoutube.com" does not.
+_DOMAIN_TO_PLATFORM = {domain: name for name, domains in PLATFORM_DOMAINS.items() for domain in domains}
+
+@functools.lru_cache(maxsize=1024)
+def detect_platform(url):
+    """Return the platform key for a URL (e.g. 'youtube'), or None if the site isn't supported."""
+    host = (urlparse(url).hostname or '').casefold()
+    while host:
+        platform_name = _DOMAIN_TO_PLATFORM.get(host)
+        if platform_name:
+            return platform_name
+        host = host.partition('.')[2]
+    return None
+
+def normalize_url(url):
+    """Drop share-tracking query parameters so the same video always maps to the same cache key."""
+    parts = urlparse(url)
+    if not parts.query:
+        return url
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if k not in TRACKING_PARAMS and not k.startswith('utm_')]
+    return parts._replace(query=urlencode(query)).geturl()
+
+def is_direct_media_url(url):
+    """True for a plain media-file link (e.g. a CDN .mp4) on a site without a dedicated extractor."""
+    return detect_platform(url) is None and urlparse(url).path.lower().endswith(DIRECT_MEDIA_EXTENSIONS)
+
+def is_supported_url(url):
+    """True for an http(s) URL on a supported platform, or a direct media-file link.
+    
+    Lets the menus reject a typo before yt-dlp spends seconds trying every extractor on it.
+    """
+    if not url.lower().startswith(('http://', 'https://')):
+        return False
+    return detect_platform(url) is not None or is_direct_media_url(url)
+
+@functools.cache
+def _youtube_dl():
+    """Import yt-dlp on first use; it is the slowest import and the menu doesn't need it."""
+    from yt_dlp import YoutubeDL
+    return YoutubeDL
+
+# The OS and environment don't change during a run, so they are probed
+# once per process and shared by every SocialMediaGrabber instance.
+@functools.cache
+def _probe_env():
+    """Detect the operating system and its default download directory. Returns (os_name, download_dir)."""
+    if 'termux' in os.environ.get('PREFIX', '').lower():
+        return "Android (Termux)", Path("/storage/emulated/0/Download")
+    os_name = {'linux': "Linux", 'windows': "Windows", 'darwin': "macOS"}.get(platform.system().lower(), "Unknown OS")
+    return os_name, Path.home() / "Downloads"
 
 class SocialMediaGrabber:
-    def __init__(self):
-        self.os_name = self.detect_os()
-        self.download_dir = self.get_default_download_dir()
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, fragments=DEFAULT_FRAGMENTS, audio_codec='mp3'):
+        self.os_name, self.download_dir = _probe_env()
+        self._title_panel, self._menu_table = self._build_main_menu()
+        self._dispatch = {
+            '1': functools.partial(self.handle_single_download, 'video'),
+            '2': functools.partial(self.handle_single_download, 'audio'),
+            '3': self.handle_batch_download,
+            '4': self.handle_subtitles_download,
+            '5': self.set_custom_download_dir,
+            '6': self._show_about_and_wait,
+            '7': self._exit,
+            '8': self._clear_cache_and_wait,
+        }
         self.ffmpeg_installed = False
+        self.aria2c_installed = False
+        self.concurrency = max(1, concurrency)
+        self.fragments = max(1, fragments)
+        self.audio_codec = audio_codec  # 'mp3' to transcode, 'copy' to keep the source codec
+        self._dir_verified = False
+        self._info_cache = OrderedDict()  # url -> (timestamp, info dict), LRU order
+        self._info_cache_lock = threading.Lock()
         self.check_dependencies()
         
-    def detect_os(self):
-        """Detect the operating system and environment."""
-        system = platform.system().lower()
-        if 'termux' in os.environ.get('PREFIX', '').lower():
-            return "Android (Termux)"
-        elif system == 'linux':
-            return "Linux"
-        elif system == 'windows':
-            return "Windows"
-        elif system == 'darwin':
-            return "macOS"
-        else:
-            return "Unknown OS"
+    @property
+    def download_dir(self):
+        """Directory downloads are saved to."""
+        return self._download_dir
     
-    def get_default_download_dir(self):
-        """Get the default download directory based on OS."""
-        home = str(Path.home())
-        
-        if "Android" in self.os_name:
-            return Path("/storage/emulated/0/Download")
-        elif self.os_name == "Windows":
-            return Path(home) / "Downloads"
-        else:  # Linux, macOS
-            return Path(home) / "Downloads"
+    @download_dir.setter
+    def download_dir(self, path):
+        self._download_dir = path
+        # Output paths are built per URL, so keep the joined directory prefix ready
+        self._output_dir_prefix = os.path.join(path, "")
+    
+    def output_path(self, name, ext="%(ext)s"):
+        """Full path (or yt-dlp output template) for a file in the download directory."""
+        return f"{self._output_dir_prefix}{FILENAME_PREFIX}_{name}.{ext}"
+    
+    def verify_download_dir(self):
+        """Check once, on the first download, that the download directory is writable."""
+        if self._dir_verified:
+            return
+        # One access(2) call instead of a write probe; a missing directory is
+        # fine since yt-dlp creates it on the first download.
+        if not os.access(self.download_dir, os.W_OK) and self.download_dir.exists():
+            console.print(f"[red]Warning: {self.download_dir} is not writable, using the current directory instead.[/red]")
+            self.download_dir = Path.cwd()
+        self._dir_verified = True
     
     def check_dependencies(self):
         """Check and install required dependencies."""
         try:
-            # Check if yt-dlp is available
-            import yt_dlp
+            # Check if yt-dlp is available without importing it; the import
+            # itself is deferred to the first download (see _youtube_dl)
+            if importlib.util.find_spec("yt_dlp") is None:
+                raise ImportError("yt_dlp")
             
-            # Check if ffmpeg is available
-            try:
-                subprocess.run(["ffmpeg", "-version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+            # aria2c is optional; when present it opens parallel connections per file
+            self.aria2c_installed = shutil.which("aria2c") is not None
+            
+            # Check if ffmpeg is available (a PATH lookup, no process spawn)
+            if shutil.which("ffmpeg"):
                 self.ffmpeg_installed = True
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                if "Android" in self.os_name:
-                    self.install_android_dependencies()
-                else:
-                    console.print("[red]Warning: ffmpeg is not installed. Audio conversion may not work.[/red]")
+            elif "Android" in self.os_name:
+                self.install_android_dependencies()
+            else:
+                console.print("[red]Warning: ffmpeg is not installed. Audio conversion may not work.[/red]")
         except ImportError:
             if "Android" in self.os_name:
                 self.install_android_dependencies()
             else:
-                console.print("[red]Error: Required packages not installed. Please install yt-dlp, ffmpeg, tqdm, and rich.[/red]")
+                console.print("[red]Error: Required packages not installed. Please install yt-dlp, ffmpeg, and rich.[/red]")
                 sys.exit(1)
     
     def install_android_dependencies(self):
         """Install dependencies for Termux."""
         console.print("[yellow]Installing required packages for Termux...[/yellow]")
         try:
-            subprocess.run(["pkg", "install", "ffmpeg", "-y"], check=True)
-            subprocess.run(["pip", "install", "yt-dlp", "tqdm", "rich", "ffmpeg-python"], check=True)
+            commands = (["pkg", "install", "ffmpeg", "aria2", "-y"], ["pip", "install", "yt-dlp", "rich"])
+            # pkg and pip resolve and download independently, so run them side by side
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(commands)) as pool:
+                list(pool.map(functools.partial(subprocess.run, check=True), commands))
             self.ffmpeg_installed = True
+            self.aria2c_installed = shutil.which("aria2c") is not None
             console.print("[green]Dependencies installed successfully![/green]")
         except subprocess.CalledProcessError as e:
             console.print(f"[red]Failed to install dependencies: {e}[/red]")
             sys.exit(1)
     
-    def generate_filename(self, url, ext="mp4"):
-        """Generate a unique filename with prefix."""
-        random_num = random.randint(100000, 999999)
-        return f"AnmolKhadkaSocialMediaGrabber_{random_num}.{ext}"
-    
     def get_video_info(self, url):
-        """Fetch video metadata using yt-dlp."""
+        """Fetch video metadata using yt-dlp and show it in an info panel. Returns the info dict, or None on failure."""
+        try:
+            info = self._fetch_info(url)
+            self._render_info(info)
+            return info
+        except Exception as e:
+            console.print(f"[red]Error fetching video info: {e}[/red]")
+            return None
+    
+    def _fetch_info(self, url):
+        """Extract a URL's metadata without downloading or rendering anything; raises on failure."""
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
+            'skip_download': True,
             'extract_flat': False,
-            'force_generic_extractor': True,
         }
         
-        try:
-            with YoutubeDL(ydl_opts) as ydl:
+        # A recent run may already have fetched this URL; showing its
+        # metadata needs no network round-trip.
+        info = self._load_persisted_info(url)
+        if info is None:
+            with self._make_ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
-                
-                # Format the information for display
-                title = info.get('title', 'N/A')
-                uploader = info.get('uploader', 'N/A')
-                upload_date = info.get('upload_date', 'N/A')
-                if upload_date != 'N/A':
-                    upload_date = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
-                likes = info.get('like_count', 'N/A')
-                if likes != 'N/A':
-                    likes = f"{int(likes):,}"
-                duration = info.get('duration', 'N/A')
-                if duration != 'N/A':
-                    minutes, seconds = divmod(duration, 60)
-                    duration = f"{minutes} minutes, {seconds} seconds"
-                
-                # Estimate size (approximate)
-                formats = info.get('formats', [])
-                if formats:
-                    best_format = max(formats, key=lambda x: x.get('filesize', 0) if x.get('filesize') else 0)
-                    size = best_format.get('filesize', 'N/A')
-                    if size != 'N/A':
-                        size_mb = size / (1024 * 1024)
-                        size = f"~{size_mb:.1f} MB"
-                else:
-                    size = 'N/A'
-                
-                description = info.get('description', 'N/A')
-                if description != 'N/A' and len(description) > 100:
-                    description = description[:100] + "..."
-                
-                # Create info panel
-                info_text = Text()
-                info_text.append(f"✔️ Video found successfully!\n", style="bold green")
-                info_text.append(f"📺 Title : {title}\n")
-                info_text.append(f"🎬 Uploader : {uploader}\n")
-                info_text.append(f"📅 Upload Date : {upload_date}\n")
-                info_text.append(f"👍 Likes : {likes}\n")
-                info_text.append(f"⏱ Duration : {duration}\n")
-                info_text.append(f"🗂 Size : {size}\n")
-                info_text.append(f"📝 Description : {description}")
-                
-                console.print(Panel(info_text, title="Video Information", border_style="blue", box=ROUNDED))
-                return info
-                
-        except Exception as e:
-            console.print(f"[red]Error fetching video info: {e}[/red]")
-            return None
+                self._cache_info(url, info)
+                self._persist_info(url, ydl.sanitize_info(info))
+        return info
     
-    def download_video(self, url, quality='best'):
-        """Download video in specified quality."""
-        filename = self.generate_filename(url)
-        output_path = str(self.download_dir / filename)
+    def _render_info(self, info):
+        """Print the Video Information panel for an info dict."""
+        # Format the information for display; extractors often set missing fields to None
+        title = info.get('title') or 'N/A'
+        uploader = info.get('uploader') or 'N/A'
+        upload_date = info.get('upload_date') or 'N/A'
+        if upload_date != 'N/A':
+            upload_date = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
+        likes = info.get('like_count')
+        likes = 'N/A' if likes is None else f"{int(likes):,}"
+        duration = info.get('duration')
+        if duration is None:
+            duration = 'N/A'
+        else:
+            minutes, seconds = divmod(int(duration), 60)
+            duration = f"{minutes} minutes, {seconds} seconds"
         
+        # Estimate size (approximate); many formats only carry filesize_approx
+        largest = 0
+        for f in info.get('formats') or ():
+            f_size = f.get('filesize') or f.get('filesize_approx') or 0
+            if f_size > largest:
+                largest = f_size
+        size = f"~{largest / (1024 * 1024):.1f} MB" if largest else 'N/A'
+        
+        description = info.get('description') or 'N/A'
+        if len(description) > 100:
+            description = description[:100] + "..."
+        
+        # Create info panel
+        info_text = Text()
+        info_text.append(f"✔️ Video found successfully!\n", style="bold green")
+        info_text.append(f"📺 Title : {title}\n")
+        info_text.append(f"🎬 Uploader : {uploader}\n")
+        info_text.append(f"📅 Upload Date : {upload_date}\n")
+        info_text.append(f"👍 Likes : {likes}\n")
+        info_text.append(f"⏱ Duration : {duration}\n")
+        info_text.append(f"🗂 Size : {size}\n")
+        info_text.append(f"📝 Description : {description}")
+        
+        console.print(Panel(info_text, title="Video Information", border_style="blue", box=ROUNDED))
+    
+    def _ydl_opts(self, download_type, outtmpl, progress_hook, quality=DEFAULT_VIDEO_FORMAT, ffmpeg_threads=FFMPEG_THREADS):
+        """Build the yt-dlp options for a download type ('video', 'audio', 'audio_source' or 'subtitles')."""
         ydl_opts = {
-            'format': quality,
-            'outtmpl': output_path,
-            'progress_hooks': [self.progress_hook],
+            'outtmpl': outtmpl,
+            'progress_hooks': [progress_hook] if progress_hook else [],
             'quiet': True,
             'no_warnings': True,
+            'concurrent_fragment_downloads': self.fragments,
+            # Output names are deterministic, so a rerun picks up the .part file
+            'continuedl': True,
+            'buffersize': DOWNLOAD_BUFFER_SIZE,
+            # Ranged requests of this size; Termux storage flushes slowly, so it gets smaller ones
+            'http_chunk_size': ANDROID_HTTP_CHUNK_SIZE if "Android" in self.os_name else HTTP_CHUNK_SIZE,
+            'retries': DOWNLOAD_RETRIES,
+            'fragment_retries': DOWNLOAD_RETRIES,
+            'postprocessor_args': {'ffmpeg': ['-threads', str(ffmpeg_threads)]},
         }
+        if self.aria2c_installed:
+            # aria2c's ranged connections help single-file HTTP downloads; HLS/DASH
+            # stay on yt-dlp's native downloader, which fetches fragments concurrently.
+            ydl_opts['external_downloader'] = {'http': 'aria2c'}
+            ydl_opts['external_downloader_args'] = {'aria2c': ARIA2C_ARGS}
+        if download_type == 'video':
+            # A list of qualities becomes one "f1,f2" selector: a single
+            # extraction, with every rendition downloaded by the same job.
+            qualities = [quality] if isinstance(quality, str) else quality
+            if not self.ffmpeg_installed:
+                qualities = [SINGLE_FILE_FORMATS.get(q, q) for q in qualities]
+            ydl_opts['format'] = ','.join(qualities)
+            ydl_opts['merge_output_format'] = 'mp4'
+        elif download_type == 'audio' and self.audio_codec == 'copy':
+            # 'best' makes ffmpeg copy the AAC/Opus stream out instead of re-encoding it
+            ydl_opts['format'] = 'bestaudio/best'
+            ydl_opts['postprocessors'] = [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'best',
+            }]
+        elif download_type == 'audio':
+            ydl_opts['format'] = 'bestaudio/best'
+            ydl_opts['postprocessors'] = [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'mp3',
+                'preferredquality': '192',
+            }]
+        elif download_type == 'audio_source':
+            ydl_opts['format'] = 'bestaudio/best'
+        elif download_type == 'subtitles':
+            ydl_opts.update({
+                'writesubtitles': True,
+                'writeautomaticsub': True,  # uploaded subtitles still win when both exist
+                'subtitlesformat': 'vtt',
+                'subtitleslangs': ['en'],
+                'skip_download': True,
+            })
+        return ydl_opts
+    
+    def _make_ydl(self, ydl_opts):
+        """Create a YoutubeDL instance; batches keep one per download slot and reuse it across URLs."""
+        # Every instance shares one persistent cache, so YouTube's player JS
+        # and signature functions are fetched once rather than once per run
+        return _youtube_dl()({'cachedir': str(YTDLP_CACHE_DIR), **ydl_opts})
+    
+    @contextlib.contextmanager
+    def _open_ydl(self, ydl, ydl_opts, url, prefix=""):
+        """Yield a fresh YoutubeDL with its own progress bar, or a shared one retargeted to this URL's output template."""
+        if ydl is not None:
+            ydl.params['outtmpl']['default'] = ydl_opts['outtmpl']
+            yield ydl
+            return
+        with self._progress_bar(url, prefix) as hook, self._make_ydl(dict(ydl_opts, progress_hooks=[hook])) as ydl:
+            yield ydl
+    
+    @contextlib.contextmanager
+    def _progress_bar(self, url, prefix=""):
+        """Show a Rich progress bar for one download; yields the progress hook that drives it."""
+        progress = Progress(
+            TextColumn("{task.description}"), BarColumn(), DownloadColumn(), TransferSpeedColumn(), TimeRemainingColumn(),
+            console=console, transient=True,
+        )
+        task_id = progress.add_task(f"{prefix}Downloading", total=None)
+        with progress:
+            yield functools.partial(self.progress_hook, progress, {url: task_id}, {})
+    
+    def _cache_info(self, url, info):
+        """Remember an extracted info dict so a following download can skip re-extraction."""
+        with self._info_cache_lock:
+            self._info_cache[url] = (time.monotonic(), info)
+            self._info_cache.move_to_end(url)
+            while len(self._info_cache) > INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+    
+    def _cached_info(self, url):
+        """Return a copy of a fresh cached info dict for url, or None."""
+        with self._info_cache_lock:
+            entry = self._info_cache.get(url)
+            if entry is None:
+                return None
+            fetched_at, info = entry
+            if time.monotonic() - fetched_at > INFO_CACHE_TTL:
+                del self._info_cache[url]
+                return None
+            self._info_cache.move_to_end(url)
+        # yt-dlp annotates the dict while downloading, so hand out a copy
+        return copy.deepcopy(info)
+    
+    def _load_persisted_info(self, url):
+        """Return the metadata a previous run stored for url, or None if it is missing or older than INFO_DB_TTL.
+        
+        Persisted entries only feed the info panel; their media URLs may have
+        expired, so downloads never reuse them.
+        """
+        try:
+            with contextlib.closing(sqlite3.connect(INFO_DB_PATH)) as db:
+                row = db.execute(
+                    "SELECT info FROM meta WHERE url = ? AND fetched > ?", (normalize_url(url), time.time() - INFO_DB_TTL)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]))
+    
+    def _persist_info(self, url, info):
+        """Store a sanitized info dict, zlib-compressed JSON, for later runs. Failures are ignored."""
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            blob = zlib.compress(json.dumps(info).encode())
+            with contextlib.closing(sqlite3.connect(INFO_DB_PATH)) as db, db:
+                db.execute("CREATE TABLE IF NOT EXISTS meta (url TEXT PRIMARY KEY, fetched REAL, info BLOB)")
+                db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?, ?)", (normalize_url(url), time.time(), blob))
+        except (OSError, sqlite3.Error):
+            pass
+    
+    def clear_metadata_cache(self):
+        """Forget every cached info dict, in memory and on disk."""
+        with self._info_cache_lock:
+            self._info_cache.clear()
+        if clear_info_cache():
+            console.print("[green]Metadata cache cleared.[/green]")
+        else:
+            console.print("[yellow]Metadata cache is already empty.[/yellow]")
+    
+    def _final_paths(self, ydl, info):
+        """Paths of the files yt-dlp wrote for info, after merging and post-processing."""
+        paths = [d['filepath'] for d in info.get('requested_downloads') or () if d.get('filepath')]
+        return paths or [ydl.prepare_filename(info)]
+    
+    def _run_download(self, ydl, url, info=None):
+        """Download a URL, reusing an already extracted info dict when one is given or cached."""
+        if info is None:
+            info = self._cached_info(url)
+        if info is None:
+            return ydl.extract_info(url, download=True)
+        return ydl.process_ie_result(info, download=True)
+    
+    def _prefetch_info(self, url, local):
+        """Extract and process a URL's metadata without downloading. Returns None on failure so the download extracts normally."""
+        if is_direct_media_url(url):
+            return None
+        try:
+            # One YoutubeDL per prefetch thread, reused for every URL it resolves
+            ydl = getattr(local, 'ydl', None)
+            if ydl is None:
+                ydl = local.ydl = self._make_ydl({'quiet': True, 'no_warnings': True})
+            return ydl.extract_info(url, download=False)
+        except Exception:
+            return None
+    
+    def download_direct(self, url, prefix="", ydl=None):
+        """Stream a direct media-file link without running a yt-dlp extractor. Returns the output path, or None on failure."""
+        self.verify_download_dir()
+        file_name = Path(urlparse(url).path)
+        # This path never resumes, so each download gets a unique name; a stem
+        # like "video" is shared by unrelated files on different hosts.
+        output_path = self.output_path(f"{file_name.stem}_{uuid.uuid4().hex[:8]}", ext=file_name.suffix.lstrip('.').lower())
+        # A batch's shared instance carries the batch hook, so the URL's bar still moves
+        progress_bar = contextlib.nullcontext(None) if ydl is not None else self._progress_bar(url, prefix)
+        info_dict = {'original_url': url}
         
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                console.print(f"[yellow]Downloading video...[/yellow]")
-                ydl.download([url])
-                console.print(f"[green]Video downloaded successfully to:[/green] {output_path}")
+            console.print(f"[yellow]{prefix}Downloading file...[/yellow]")
+            # verify_download_dir leaves a missing directory for yt-dlp to create; this path bypasses yt-dlp
+            self.download_dir.mkdir(parents=True, exist_ok=True)
+            request = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+            with progress_bar as bar_hook, urllib.request.urlopen(request, timeout=30) as response, open(output_path, 'wb') as f:
+                hooks = [bar_hook] if bar_hook else ydl.params['progress_hooks']
+                total_bytes = int(response.headers.get('Content-Length') or 0) or None
+                downloaded_bytes, start = 0, time.monotonic()
+                while chunk := response.read(DIRECT_CHUNK_SIZE):
+                    f.write(chunk)
+                    downloaded_bytes += len(chunk)
+                    elapsed = time.monotonic() - start
+                    speed = downloaded_bytes / elapsed if elapsed else None
+                    eta = int((total_bytes - downloaded_bytes) / speed) if total_bytes and speed else None
+                    for hook in hooks:
+                        hook({'status': 'downloading', 'downloaded_bytes': downloaded_bytes, 'total_bytes': total_bytes,
+                              'speed': speed, 'eta': eta, 'info_dict': info_dict})
+                for hook in hooks:
+                    hook({'status': 'finished', 'downloaded_bytes': downloaded_bytes, 'total_bytes': downloaded_bytes,
+                          'info_dict': info_dict})
+            console.print(f"[green]{prefix}File downloaded successfully to:[/green] {output_path}")
+            return output_path
         except Exception as e:
-            console.print(f"[red]Error downloading video: {e}[/red]")
+            Path(output_path).unlink(missing_ok=True)
+            console.print(f"[red]{prefix}Error downloading file: {e}[/red]")
+            return None
     
-    def download_audio(self, url):
-        """Download audio as MP3."""
-        filename = self.generate_filename(url, ext="mp3")
-        output_path = str(self.download_dir / filename)
+    def download_video(self, url, quality=DEFAULT_VIDEO_FORMAT, prefix="", ydl=None, info=None):
+        """Download video in specified quality, or in each of a list of qualities. Returns the output path, or None on failure."""
+        if is_direct_media_url(url):
+            return self.download_direct(url, prefix=prefix, ydl=ydl)
+        self.verify_download_dir()
+        # The format ID keeps each quality of a video in its own file
+        output_template = self.output_path("%(id)s", ext="%(format_id)s.%(ext)s")
+        ydl_opts = self._ydl_opts('video', output_template, None, quality)
         
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'outtmpl': output_path,
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
-            'progress_hooks': [self.progress_hook],
-            'quiet': True,
-            'no_warnings': True,
-        }
+        try:
+            with self._open_ydl(ydl, ydl_opts, url, prefix) as ydl:
+                console.print(f"[yellow]{prefix}Downloading video...[/yellow]")
+                info = self._run_download(ydl, url, info)
+                paths = self._final_paths(ydl, info)
+                console.print(f"[green]{prefix}Video downloaded successfully to:[/green] {', '.join(paths)}")
+                return paths[0] if len(paths) == 1 else paths
+        except Exception as e:
+            console.print(f"[red]{prefix}Error downloading video: {e}[/red]")
+            return None
+    
+    def download_audio(self, url, prefix="", ydl=None, info=None):
+        """Download audio as MP3, or in its source codec with audio_codec='copy'. Returns the output path, or None on failure."""
+        # A direct file only skips yt-dlp when it is already in the wanted audio format
+        direct_exts = ('.mp3', '.m4a') if self.audio_codec == 'copy' else ('.mp3',)
+        if is_direct_media_url(url) and urlparse(url).path.lower().endswith(direct_exts):
+            return self.download_direct(url, prefix=prefix, ydl=ydl)
+        self.verify_download_dir()
+        ydl_opts = self._ydl_opts('audio', self.output_path(AUDIO_NAME), None)
         
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                console.print(f"[yellow]Downloading audio...[/yellow]")
-                ydl.download([url])
-                console.print(f"[green]Audio downloaded successfully to:[/green] {output_path}")
+            with self._open_ydl(ydl, ydl_opts, url, prefix) as ydl:
+                console.print(f"[yellow]{prefix}Downloading audio...[/yellow]")
+                info = self._run_download(ydl, url, info)
+                output_path = self._final_paths(ydl, info)[0]
+                console.print(f"[green]{prefix}Audio downloaded successfully to:[/green] {output_path}")
+                return output_path
         except Exception as e:
-            console.print(f"[red]Error downloading audio: {e}[/red]")
+            console.print(f"[red]{prefix}Error downloading audio: {e}[/red]")
+            return None
     
-    def download_subtitles(self, url):
-        """Download subtitles for YouTube videos."""
-        filename = self.generate_filename(url, ext="vtt")
-        output_path = str(self.download_dir / filename)
+    def fetch_audio_source(self, url, prefix="", ydl=None, info=None):
+        """Download the best audio stream without transcoding. Returns the source path, or None on failure."""
+        if is_direct_media_url(url):
+            return self.download_direct(url, prefix=prefix, ydl=ydl)
+        self.verify_download_dir()
+        ydl_opts = self._ydl_opts('audio_source', self.output_path(AUDIO_NAME), None)
         
-        ydl_opts = {
-            'writesubtitles': True,
-            'subtitlesformat': 'vtt',
-            'subtitleslangs': ['en'],
-            'outtmpl': output_path.replace('.vtt', ''),
-            'quiet': True,
-            'no_warnings': True,
-            'skip_download': True,
-        }
+        try:
+            with self._open_ydl(ydl, ydl_opts, url, prefix) as ydl:
+                console.print(f"[yellow]{prefix}Downloading audio...[/yellow]")
+                info = self._run_download(ydl, url, info)
+                return self._final_paths(ydl, info)[0]
+        except Exception as e:
+            console.print(f"[red]{prefix}Error downloading audio: {e}[/red]")
+            return None
+    
+    def convert_to_mp3(self, source_path, prefix=""):
+        """Transcode a downloaded audio file to MP3 and remove the source. Returns the MP3 path, or None on failure.
+        
+        Runs single-threaded: batches run one conversion per CPU in parallel.
+        """
+        source = Path(source_path)
+        if source.suffix.lower() == ".mp3":
+            return str(source)
+        output_path = source.with_suffix(".mp3")
         
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                console.print(f"[yellow]Downloading subtitles...[/yellow]")
-                ydl.download([url])
-                console.print(f"[green]Subtitles downloaded successfully to:[/green] {output_path}")
+            subprocess.run(
+                ["ffmpeg", "-y", "-loglevel", "error", "-threads", "1", "-i", str(source),
+                 "-vn", "-codec:a", "libmp3lame", "-b:a", "192k", "-threads", "1", str(output_path)],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True
+            )
+            source.unlink(missing_ok=True)
+            console.print(f"[green]{prefix}Audio downloaded successfully to:[/green] {output_path}")
+            return str(output_path)
+        except (subprocess.CalledProcessError, OSError) as e:
+            console.print(f"[red]{prefix}Error converting audio: {e}[/red]")
+            return None
+    
+    def download_subtitles(self, url, prefix="", ydl=None, info=None):
+        """Download subtitles for YouTube videos. Returns the output path, or None on failure."""
+        if detect_platform(url) != 'youtube':
+            console.print(f"[red]{prefix}Error: Subtitles download only works with YouTube URLs.[/red]")
+            return None
+        self.verify_download_dir()
+        # The info panel (or a batch prefetch) usually extracted the video
+        # already; its subtitle URL can be fetched without running yt-dlp again
+        info = info or self._cached_info(url)
+        track = self._subtitle_track(info) if info else None
+        if track is not None:
+            console.print(f"[yellow]{prefix}Downloading subtitles...[/yellow]")
+            output_path = self.output_path(info['id'], ext="en.vtt")
+            if self._fetch_subtitles(track['url'], output_path):
+                console.print(f"[green]{prefix}Subtitles downloaded successfully to:[/green] {output_path}")
+                return output_path
+        ydl_opts = self._ydl_opts('subtitles', self.output_path("%(id)s"), None)
+        
+        try:
+            with self._open_ydl(ydl, ydl_opts, url, prefix) as ydl:
+                console.print(f"[yellow]{prefix}Downloading subtitles...[/yellow]")
+                info = self._run_download(ydl, url, info)
+                subtitles = (info.get('requested_subtitles') or {}).values()
+                output_path = next((sub['filepath'] for sub in subtitles if sub.get('filepath')), None)
+                if output_path is None:
+                    console.print(f"[red]{prefix}Error: No English subtitles found.[/red]")
+                    return None
+                console.print(f"[green]{prefix}Subtitles downloaded successfully to:[/green] {output_path}")
+                return output_path
         except Exception as e:
-            console.print(f"[red]Error downloading subtitles: {e}[/red]")
-    
-    def batch_download(self, urls, download_type='video'):
-        """Download multiple URLs in batch."""
-        for i, url in enumerate(urls, 1):
-            console.print(f"\n[yellow]Processing URL {i} of {len(urls)}[/yellow]")
-            if download_type == 'video':
-                self.download_video(url)
-            elif download_type == 'audio':
-                self.download_audio(url)
-            elif download_type == 'subtitles':
-                self.download_subtitles(url)
-    
-    def progress_hook(self, d):
-        """Progress hook for yt-dlp to show download progress."""
+            console.print(f"[red]{prefix}Error downloading subtitles: {e}[/red]")
+            return None
+    
+    def _subtitle_track(self, info, lang='en', ext='vtt'):
+        """Return info's subtitle entry for lang in ext, preferring uploaded subtitles over automatic captions."""
+        for source in ('subtitles', 'automatic_captions'):
+            for track in (info.get(source) or {}).get(lang) or ():
+                if track.get('ext') == ext and track.get('url'):
+                    return track
+        return None
+    
+    def _fetch_subtitles(self, sub_url, output_path):
+        """Save a subtitle file with one plain HTTP GET. Returns False so the caller can fall back to yt-dlp."""
+        try:
+            request = urllib.request.Request(sub_url, headers={'User-Agent': 'Mozilla/5.0'})
+            with urllib.request.urlopen(request, timeout=30) as response:
+                data = response.read()
+            if not data:
+                return False
+            self.download_dir.mkdir(parents=True, exist_ok=True)
+            Path(output_path).write_bytes(data)
+            return True
+        except Exception:
+            return False
+    
+    def batch_download(self, urls, download_type='video', qualities=None):
+        """Download multiple URLs in batch (starting each as it arrives), up to self.concurrency at a time."""
+        self.verify_download_dir()
+        results = asyncio.run(self._batch_download_async(urls, download_type, qualities))
+        if not results:
+            console.print("[red]Error: No URLs provided.[/red]")
+            return
+        success_count = sum(1 for result in results if result)
+        console.print(f"\n[green]Batch finished: {success_count} of {len(results)} downloaded successfully.[/green]")
+    
+    async def _aiter_urls(self, urls):
+        """Yield URLs from a list, or from a blocking iterator (such as stdin) read in a thread."""
+        if isinstance(urls, (list, tuple)):
+            for url in urls:
+                yield url
+            return
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        
+        def read():
+            # Once the batch is cancelled the loop is closed; the thread just ends
+            with contextlib.suppress(RuntimeError):
+                try:
+                    for url in urls:
+                        loop.call_soon_threadsafe(queue.put_nowait, url)
+                finally:
+                    loop.call_soon_threadsafe(queue.put_nowait, None)
+        
+        # A daemon thread of its own: busy download threads can't delay the next
+        # line, and Ctrl-C doesn't have to wait for a read blocked on stdin
+        threading.Thread(target=read, daemon=True).start()
+        while (url := await queue.get()) is not None:
+            yield url
+    
+    async def _batch_download_async(self, urls, download_type, qualities=None):
+        """Run the batch downloads concurrently; yt-dlp is blocking, so each one runs in a thread."""
+        # For audio, ffmpeg runs after the download slot is released so the
+        # next URL's fetch overlaps with the previous file's transcode.
+        pipeline_audio = download_type == 'audio' and self.audio_codec == 'mp3' and self.ffmpeg_installed
+        if pipeline_audio:
+            download, opts_type = self.fetch_audio_source, 'audio_source'
+        else:
+            downloaders = {
+                'video': self.download_video,
+                'audio': self.download_audio,
+                'subtitles': self.download_subtitles,
+            }
+            download, opts_type = downloaders[download_type], download_type
+        quality = qualities or DEFAULT_VIDEO_FORMAT
+        if download_type == 'video' and qualities:
+            download = functools.partial(download, quality=quality)
+        
+        # One progress bar per URL, drawn by Rich's single refresh thread so
+        # concurrent downloads don't contend on console output.
+        total = len({normalize_url(url) for url in urls}) if isinstance(urls, (list, tuple)) else None
+        progress = Progress(
+            TextColumn("{task.description}"), BarColumn(), DownloadColumn(), TransferSpeedColumn(),
+            console=console,
+        )
+        batch_progress = Progress(TextColumn("{task.description}"), BarColumn(), MofNCompleteColumn(), console=console)
+        batch_task = batch_progress.add_task("Batch", total=total)
+        task_ids = {}
+        last_update = {}
+        
+        # Each download slot owns one YoutubeDL, created on first use and
+        # reused for every URL it handles. Shared instances can't carry a
+        # per-URL hook, so the bar is looked up by the info dict's URL.
+        # Parallel downloads share the CPU, so each ffmpeg postprocessor gets its slice
+        ffmpeg_threads = max(1, (os.cpu_count() or 1) // self.concurrency)
+        shared_opts = self._ydl_opts(
+            opts_type, "", functools.partial(self.progress_hook, progress, task_ids, last_update), quality, ffmpeg_threads
+        )
+        slots = asyncio.Queue()
+        for _ in range(self.concurrency):
+            slots.put_nowait(None)
+        results = []
+        loop = asyncio.get_running_loop()
+        prefetch_local = threading.local()
+        
+        # Metadata is resolved ahead of the download slots, so extractor
+        # round-trips stay off the download path, but only a bounded number of
+        # URLs ahead: each info dict is large and its signed media URLs expire.
+        lookahead = asyncio.Semaphore(self.concurrency + PREFETCH_WORKERS)
+        # Files are named by video ID, so two URLs for one video (a repeat
+        # paste, youtu.be/X next to watch?v=X) would write the same .part file.
+        seen_urls, seen_videos, duplicate = set(), set(), object()
+        
+        async def bounded(index, url, prefix, stack):
+            async with lookahead:
+                info = await loop.run_in_executor(prefetch_pool, self._prefetch_info, url, prefetch_local)
+                video_key = (info.get('extractor_key'), info.get('id')) if info else None
+                if video_key in seen_videos:
+                    console.print(f"[yellow]{prefix}Skipping {url}: same video as an earlier URL.[/yellow]")
+                    progress.remove_task(task_ids.pop(url))
+                    results[index] = duplicate
+                    batch_progress.advance(batch_task)
+                    return
+                if video_key:
+                    seen_videos.add(video_key)
+                ydl = await slots.get()
+                try:
+                    if ydl is None:
+                        ydl = stack.enter_context(await loop.run_in_executor(download_pool, self._make_ydl, shared_opts))
+                    console.print(f"\n[yellow]{prefix}Processing {url}[/yellow]")
+                    result = await loop.run_in_executor(
+                        download_pool, functools.partial(download, url, prefix=prefix, ydl=ydl, info=info)
+                    )
+                finally:
+                    slots.put_nowait(ydl)
+            if pipeline_audio and result:
+                result = await loop.run_in_executor(
+                    ffmpeg_pool, functools.partial(self.convert_to_mp3, result, prefix=prefix)
+                )
+            results[index] = result
+            batch_progress.advance(batch_task)
+        
+        # One thread per slot; the default executor is capped at cpu_count + 4
+        # and would silently limit --concurrency.
+        pools = (
+            concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency),
+            concurrent.futures.ThreadPoolExecutor(max_workers=PREFETCH_WORKERS),
+            concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()),
+        )
+        download_pool, prefetch_pool, ffmpeg_pool = pools
+        with contextlib.ExitStack() as stack:
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    async for url in self._aiter_urls(urls):
+                        if normalize_url(url) in seen_urls:
+                            console.print(f"[yellow]Skipping duplicate URL: {url}[/yellow]")
+                            continue
+                        seen_urls.add(normalize_url(url))
+                        index = len(results)
+                        results.append(None)
+                        prefix = f"[{index + 1}/{total}] " if total else f"[{index + 1}] "
+                        task_ids[url] = progress.add_task(f"{prefix}{url}", total=None)
+                        tg.create_task(bounded(index, url, prefix, stack))
+                    # Only draw the live bars once input is finished, so they don't
+                    # redraw over URLs the user is still typing.
+                    batch_progress.update(batch_task, total=len(results))
+                    stack.enter_context(Live(Group(batch_progress, progress), console=console))
+            except BaseException:
+                # Cancelled (Ctrl-C) or failed: drop queued URLs and don't wait
+                # for downloads already in flight
+                for pool in pools:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            for pool in pools:
+                pool.shutdown()
+        return [result for result in results if result is not duplicate]
+    
+    def progress_hook(self, progress, task_ids, last_update, d):
+        """Progress hook for yt-dlp; updates the bar of the URL being downloaded.
+        
+        task_ids maps each URL to its task in progress. Batches share one
+        hook across their YoutubeDL instances, so the task is looked up by
+        the info dict's original URL.
+        """
+        task_id = task_ids.get(d.get('info_dict', {}).get('original_url'))
+        if task_id is None:
+            return
         if d['status'] == 'downloading':
-            total_bytes = d.get('total_bytes')
-            downloaded_bytes = d.get('downloaded_bytes')
-            speed = d.get('speed')
-            eta = d.get('eta')
-            
-            if total_bytes and downloaded_bytes and speed and eta:
-                progress = downloaded_bytes / total_bytes
-                speed_mb = speed / (1024 * 1024)
-                console.print(f"[cyan]Progress: {progress:.1%} | Speed: {speed_mb:.1f} MB/s | ETA: {eta}s[/cyan]", end="\r")
+            # Every update takes the Progress lock; skip chunks that land
+            # between redraws instead of contending with the other slots
+            now = time.monotonic()
+            if now - last_update.get(task_id, 0.0) < PROGRESS_INTERVAL:
+                return
+            last_update[task_id] = now
+            progress.update(task_id, completed=d.get('downloaded_bytes'),
+                            total=d.get('total_bytes') or d.get('total_bytes_estimate'))
+        elif d['status'] == 'finished':
+            progress.update(task_id, completed=d.get('total_bytes') or d.get('downloaded_bytes'))
     
     def set_custom_download_dir(self):
         """Set a custom download directory."""
@@ -263,11 +833,14 @@ class SocialMediaGrabber:
         
         if new_dir:
             new_path = Path(new_dir)
-            if new_path.is_dir():
+            if not new_path.is_dir():
+                console.print("[red]Error: The specified directory does not exist.[/red]")
+            elif not os.access(new_path, os.W_OK):
+                console.print("[red]Error: The specified directory is not writable.[/red]")
+            else:
                 self.download_dir = new_path
+                self._dir_verified = True
                 console.print(f"[green]Download directory changed to: {self.download_dir}[/green]")
-            else:
-                console.print("[red]Error: The specified directory does not exist.[/red]")
     
     def show_about(self):
         """Display information about the tool and creator."""
@@ -288,54 +861,58 @@ class SocialMediaGrabber:
         
         console.print(Panel(about_text, title="About", border_style="green", box=ROUNDED))
     
+    def _build_main_menu(self):
+        """Build the main menu's title panel and option table; both are static, so they're reused on every redraw."""
+        # Create title panel
+        title_text = Text()
+        title_text.append(f"Welcome to {TOOL_NAME} v{VERSION}\n", style="bold blue")
+        title_text.append(f"OS Detected: {self.os_name}")
+        title_panel = Panel(title_text, border_style="blue", box=ROUNDED)
+        
+        # Create menu table
+        menu_table = Table(show_header=False, box=ROUNDED)
+        menu_table.add_column("Option", style="cyan")
+        menu_table.add_column("Description", style="white")
+        
+        menu_table.add_row("1️⃣", "Download Video (HD/full quality)")
+        menu_table.add_row("2️⃣", "Download Audio (MP3)")
+        menu_table.add_row("3️⃣", "Batch Download (Multiple URLs)")
+        menu_table.add_row("4️⃣", "Download Subtitles (YouTube only)")
+        menu_table.add_row("5️⃣", "Set Custom Download Directory")
+        menu_table.add_row("6️⃣", "About This Tool")
+        menu_table.add_row("7️⃣", "Exit")
+        menu_table.add_row("8️⃣", "Clear Metadata Cache")
+        return title_panel, menu_table
+    
     def main_menu(self):
         """Display the main menu and handle user input."""
         while True:
             console.clear()
+            console.print(self._title_panel)
+            console.print(self._menu_table)
             
-            # Create title panel
-            title_text = Text()
-            title_text.append(f"Welcome to {TOOL_NAME} v{VERSION}\n", style="bold blue")
-            title_text.append(f"OS Detected: {self.os_name}")
-            
-            console.print(Panel(title_text, border_style="blue", box=ROUNDED))
-            
-            # Create menu table
-            menu_table = Table(show_header=False, box=ROUNDED)
-            menu_table.add_column("Option", style="cyan")
-            menu_table.add_column("Description", style="white")
-            
-            menu_table.add_row("1️⃣", "Download Video (HD/full quality)")
-            menu_table.add_row("2️⃣", "Download Audio (MP3)")
-            menu_table.add_row("3️⃣", "Batch Download (Multiple URLs)")
-            menu_table.add_row("4️⃣", "Download Subtitles (YouTube only)")
-            menu_table.add_row("5️⃣", "Set Custom Download Directory")
-            menu_table.add_row("6️⃣", "About This Tool")
-            menu_table.add_row("7️⃣", "Exit")
-            
-            console.print(menu_table)
-            
-            choice = console.input("\nEnter your choice (1-7): ").strip()
-            
-            if choice == '1':
-                self.handle_single_download('video')
-            elif choice == '2':
-                self.handle_single_download('audio')
-            elif choice == '3':
-                self.handle_batch_download()
-            elif choice == '4':
-                self.handle_subtitles_download()
-            elif choice == '5':
-                self.set_custom_download_dir()
-            elif choice == '6':
-                self.show_about()
-                console.input("\nPress Enter to return to menu...")
-            elif choice == '7':
-                console.print("[yellow]Exiting... Thank you for using SocialMediaGrabber![/yellow]")
-                sys.exit(0)
-            else:
-                console.print("[red]Invalid choice. Please enter a number between 1-7.[/red]")
-                time.sleep(1)
+            choice = console.input("\nEnter your choice (1-8): ").strip()
+            self._dispatch.get(choice, self._invalid_choice)()
+    
+    def _clear_cache_and_wait(self):
+        """Menu action: clear the metadata cache, then wait for Enter."""
+        self.clear_metadata_cache()
+        console.input("\nPress Enter to return to menu...")
+    
+    def _show_about_and_wait(self):
+        """Menu action: show the About panel, then wait for Enter."""
+        self.show_about()
+        console.input("\nPress Enter to return to menu...")
+    
+    def _exit(self):
+        """Menu action: say goodbye and exit."""
+        console.print("[yellow]Exiting... Thank you for using SocialMediaGrabber![/yellow]")
+        sys.exit(0)
+    
+    def _invalid_choice(self):
+        """Menu fallback for input that isn't an option."""
+        console.print("[red]Invalid choice. Please enter a number between 1-8.[/red]")
+        time.sleep(1)
     
     def handle_single_download(self, download_type):
         """Handle single video/audio download."""
@@ -346,45 +923,63 @@ class SocialMediaGrabber:
             console.print("[red]Error: URL cannot be empty.[/red]")
             return
         
-        # Show video info first
-        self.get_video_info(url)
+        if not is_supported_url(url):
+            console.print("[red]Error: Unsupported URL. Enter a full http(s) link from one of the supported sites.[/red]")
+            console.input("\nPress Enter to return to menu...")
+            return
+        
+        # Show video info first; a direct file link has none worth extracting
+        if not is_direct_media_url(url):
+            self.get_video_info(url)
         
         if download_type == 'video':
-            self.download_video(url)
+            self.download_video(url, quality=self.choose_video_quality())
         elif download_type == 'audio':
             self.download_audio(url)
         
         console.input("\nPress Enter to return to menu...")
     
+    def choose_video_quality(self):
+        """Ask for a video quality; returns its yt-dlp format selector (best available on Enter)."""
+        console.print("\nVideo quality:")
+        for key, (label, _) in VIDEO_QUALITIES.items():
+            console.print(f"{key}. {label}")
+        choice = console.input(f"Enter your choice (1-{len(VIDEO_QUALITIES)}, Enter for best): ").strip() or '1'
+        if choice not in VIDEO_QUALITIES:
+            console.print("[yellow]Invalid choice, using the best available quality.[/yellow]")
+            choice = '1'
+        return VIDEO_QUALITIES[choice][1]
+    
     def handle_batch_download(self):
         """Handle batch download of multiple URLs."""
-        console.print("\nEnter multiple URLs (one per line). Press Enter twice when done:")
-        urls = []
-        while True:
-            url = console.input().strip()
-            if not url and urls:  # Empty line after entering at least one URL
-                break
-            if url:
-                urls.append(url)
-        
-        if not urls:
-            console.print("[red]Error: No URLs provided.[/red]")
-            return
-        
         console.print("\nDownload as:")
         console.print("1. Videos")
         console.print("2. Audio (MP3)")
         choice = console.input("Enter your choice (1-2): ").strip()
+        download_types = {'1': 'video', '2': 'audio'}
         
-        if choice == '1':
-            self.batch_download(urls, 'video')
-        elif choice == '2':
-            self.batch_download(urls, 'audio')
+        if choice in download_types:
+            quality = self.choose_video_quality() if download_types[choice] == 'video' else None
+            eof_key = "Ctrl-Z then Enter" if self.os_name == "Windows" else "Ctrl-D"
+            console.print(f"\nEnter URLs one per line; downloads start as you go. "
+                          f"Press Enter on an empty line (or {eof_key}) when done:")
+            self.batch_download(self._read_urls(), download_types[choice], quality)
         else:
             console.print("[red]Invalid choice.[/red]")
         
         console.input("\nPress Enter to return to menu...")
     
+    def _read_urls(self):
+        """Yield URLs typed or pasted on stdin until an empty line or EOF."""
+        for line in sys.stdin:
+            url = line.strip()
+            if not url:
+                return
+            if not is_supported_url(url):
+                console.print(f"[red]Skipping unsupported URL: {url}[/red]")
+                continue
+            yield url
+    
     def handle_subtitles_download(self):
         """Handle subtitles download."""
         console.print("\nNote: Subtitles download currently only works with YouTube videos.")
@@ -394,19 +989,60 @@ class SocialMediaGrabber:
             console.print("[red]Error: URL cannot be empty.[/red]")
             return
         
+        if detect_platform(url) != 'youtube':
+            console.print("[red]Error: Subtitles download only works with YouTube URLs.[/red]")
+            console.input("\nPress Enter to return to menu...")
+            return
+        
         # Show video info first
         self.get_video_info(url)
         self.download_subtitles(url)
         
         console.input("\nPress Enter to return to menu...")
 
+def clear_info_cache():
+    """Delete the persisted metadata cache. Returns True if there was one to delete."""
+    try:
+        INFO_DB_PATH.unlink()
+        return True
+    except FileNotFoundError:
+        return False
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=TOOL_NAME)
+    parser.add_argument("--version", action="version", version=f"{TOOL_NAME} v{VERSION}")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Number of parallel downloads in batch mode (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--fragments", type=int, default=DEFAULT_FRAGMENTS,
+                        help=f"Number of HLS/DASH fragments fetched in parallel per download (default: {DEFAULT_FRAGMENTS})")
+    parser.add_argument("--audio-codec", choices=["mp3", "copy"], default="mp3",
+                        help="mp3 re-encodes audio downloads; copy keeps the source AAC/Opus stream without transcoding (default: mp3)")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help=f"Delete the cached video metadata in {CACHE_DIR} and exit")
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.clear_cache:
+        if clear_info_cache():
+            console.print("[green]Metadata cache cleared.[/green]")
+        else:
+            console.print("[yellow]Metadata cache is already empty.[/yellow]")
+        sys.exit(0)
     try:
-        grabber = SocialMediaGrabber()
+        grabber = SocialMediaGrabber(
+            concurrency=args.concurrency, fragments=args.fragments, audio_codec=args.audio_codec
+        )
         grabber.main_menu()
     except KeyboardInterrupt:
         console.print("\n[yellow]Exiting... Thank you for using SocialMediaGrabber![/yellow]")
-        sys.exit(0)
+        # A cancelled batch can leave worker threads inside yt-dlp; a normal
+        # exit would join them, so leave without waiting for them
+        sys.stdout.flush()
+        os._exit(0)
     except Exception as e:
         console.print(f"[red]An unexpected error occurred: {e}[/red]")
+        # Keep the traceback so real bugs aren't hidden behind a one-line message
+        console.print_exception()
         sys.exit(1)